@@ -93,6 +93,19 @@ def example_with_model():
         # Schema is already loaded, ready to write relationships
 
 
+def example_with_http():
+    """Example: Enable the HTTP API.
+
+    This example shows how to chain builder methods to add
+    extra serve flags before the container starts.
+    """
+    with SpiceDBContainer(
+        image="authzed/spicedb:v1.47.1"
+    ).with_http(8443) as spicedb:
+        http_port = spicedb.get_exposed_port(8443)
+        print(f"SpiceDB HTTP API on port {http_port}")
+
+
 if __name__ == "__main__":
     print("Example 1: Basic container")
     example_run_container()
@@ -105,3 +118,6 @@ if __name__ == "__main__":
 
     print("\nExample 4: Pre-loaded model")
     example_with_model()
+
+    print("\nExample 5: HTTP API")
+    example_with_http()
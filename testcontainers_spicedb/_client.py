@@ -0,0 +1,21 @@
+"""SpiceDB client that keeps a handle on its gRPC channel."""
+
+import grpc
+from authzed.api.v1 import Client
+
+
+class ChannelClient(Client):
+    """authzed v1 Client with a synchronous channel it keeps a reference to.
+
+    The stock Client does not keep its channel, so it could not be closed
+    when the container stops. It also switches to a grpc.aio channel when
+    built inside an event loop; cached clients are always synchronous so
+    every caller gets the same kind of client.
+    """
+
+    def create_channel(self, target, credentials, options=None, compression=None):
+        """Create a synchronous channel and keep a reference to it."""
+        self.channel = grpc.secure_channel(
+            target, credentials, options, compression
+        )
+        return self.channel
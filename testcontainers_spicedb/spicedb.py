@@ -1,13 +1,42 @@
 """SpiceDB testcontainer module."""
 
-from typing import Optional, Callable
-from testcontainers.core.container import DockerContainer
-from testcontainers.core.waiting_utils import wait_for_logs
-from authzed.api.v1 import WriteSchemaRequest
+import asyncio
+import hashlib
+import json
+import os
+import re
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Optional, Callable, Sequence
+from testcontainers.core.config import testcontainers_config
+from testcontainers.core.container import DockerContainer, Reaper
+
+if TYPE_CHECKING:
+    import grpc
+
+    from testcontainers_spicedb._client import ChannelClient
 
 DEFAULT_SECRET_KEY = "somepresharedkey"
 DEFAULT_IMAGE = "authzed/spicedb:v1.47.1"
 DEFAULT_PORT = 50051
+READY_LOG_PATTERN = "grpc server started serving"
+DEFAULT_STARTUP_TIMEOUT = 10
+REUSE_ENV_VAR = "TESTCONTAINERS_REUSE_ENABLE"
+REUSE_HASH_LABEL = "testcontainers-spicedb.reuse-hash"
+
+# Channel arguments for one-off connections to a local container
+_CHANNEL_OPTIONS = (
+    ("grpc.keepalive_time_ms", 2**31 - 1),
+    ("grpc.enable_retries", 0),
+    ("grpc.use_local_subchannel_pool", 1),
+)
+
+# Shared, immutable command for the default secret key
+_DEFAULT_COMMAND = ("serve", "--grpc-preshared-key", DEFAULT_SECRET_KEY)
+
+# Serializes Ryuk reaper creation across threads
+_REAPER_LOCK = threading.Lock()
 
 
 class SpiceDBContainer(DockerContainer):
@@ -27,6 +56,8 @@ class SpiceDBContainer(DockerContainer):
         model_secret_key: Optional[str] = None,
         schema_writer: Optional[Callable] = None,
         port: int = DEFAULT_PORT,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+        reuse: Optional[bool] = None,
         **kwargs
     ):
         """Initialize SpiceDB container.
@@ -38,6 +69,11 @@ class SpiceDBContainer(DockerContainer):
             model_secret_key: Secret key for schema writer (defaults to secret_key)
             schema_writer: Optional custom schema writer function
             port: Port to expose (default: 50051)
+            startup_timeout: Seconds to wait for the server to be ready
+                once the container is running (default: 10)
+            reuse: Keep the container running after stop() and adopt it on
+                the next start() with the same configuration (default: the
+                TESTCONTAINERS_REUSE_ENABLE environment variable)
             **kwargs: Additional arguments passed to DockerContainer
         """
         super().__init__(image, **kwargs)
@@ -46,30 +82,147 @@ class SpiceDBContainer(DockerContainer):
         self._model_secret_key = model_secret_key or secret_key
         self._schema_writer = schema_writer
         self._port = port
-        self._endpoint = None
+        self._startup_timeout = startup_timeout
+        if reuse is None:
+            reuse = os.environ.get(REUSE_ENV_VAR, "").lower() == "true"
+        self._reuse = reuse
+        self._started = False
+        self._host: Optional[str] = None
+        self._mapped_port: Optional[int] = None
+        self._endpoint: Optional[str] = None
+        self._client_cache: dict[tuple[str, str], "ChannelClient"] = {}
+
+        # Extra serve flags added by the with_* builders; the full command
+        # is assembled once in start() unless the caller sets their own
+        self._extra_cmd: list[str] = []
+        self._command_overridden = self._command is not None
 
         # Set up container configuration
         self.with_exposed_ports(port)
-        self.with_command([
-            "serve",
-            "--grpc-preshared-key",
-            secret_key
+
+    def with_command(self, command) -> "SpiceDBContainer":
+        """Set the container command, replacing the default serve command.
+
+        Flags from with_otel() and with_http() are not added to a command
+        set this way, whether those are called before or after.
+
+        Args:
+            command: The command to run instead of the generated serve command
+
+        Returns:
+            The container, for chaining
+        """
+        self._command_overridden = True
+        super().with_command(command)
+        return self
+
+    def with_otel(self, otel_provider: str, endpoint: str) -> "SpiceDBContainer":
+        """Add OpenTelemetry configuration to the container.
+
+        Has no effect on the command if with_command() is used.
+
+        Args:
+            otel_provider: The OTEL provider to use
+            endpoint: The OTEL endpoint
+
+        Returns:
+            The container, for chaining
+        """
+        self._extra_cmd.extend([
+            "--otel-endpoint", endpoint,
+            "--otel-provider", otel_provider
         ])
+        return self
+
+    def with_http(self, port: int) -> "SpiceDBContainer":
+        """Enable the HTTP endpoint on the specified port.
+
+        The port is always exposed, but the serve flags are not added if
+        with_command() is used.
+
+        Args:
+            port: The port to expose for HTTP
+
+        Returns:
+            The container, for chaining
+        """
+        self._extra_cmd.extend([
+            "--http-enabled",
+            "--http-addr", f":{port}"
+        ])
+        self.with_exposed_ports(port)
+        return self
+
+    def _build_command(self) -> Sequence[str]:
+        """Build the serve command from the secret key and extra flags."""
+        if self._secret_key == DEFAULT_SECRET_KEY:
+            command: Sequence[str] = _DEFAULT_COMMAND
+        else:
+            command = ("serve", "--grpc-preshared-key", self._secret_key)
+        if self._extra_cmd:
+            return [*command, *self._extra_cmd]
+        return command
 
     def start(self) -> "SpiceDBContainer":
-        """Start the container and wait for it to be ready."""
-        super().start()
+        """Start the container and wait for it to be ready.
+
+        With reuse enabled, a running container with the same configuration
+        is adopted instead of starting a new one. Its earlier ready log line
+        is replayed by the log stream, so the readiness wait returns at once.
+        """
+        # Reaper.get_instance() is not thread-safe; create the reaper under a
+        # lock so concurrent starts (e.g. from astart()) share a single Ryuk
+        if (
+            not testcontainers_config.ryuk_disabled
+            and self.image != testcontainers_config.ryuk_image
+        ):
+            with _REAPER_LOCK:
+                Reaper.get_instance()
+
+        # Assemble the serve command, including flags from the with_* builders
+        if not self._command_overridden:
+            super().with_command(self._build_command())
+
+        reused = self._reuse and self._adopt_reusable_container()
+
+        if not reused:
+            super().start()
+
+        try:
+            self._finish_start(self._startup_timeout)
+        except BaseException:
+            # Never leave a broken container behind for the next run to adopt
+            if self._reuse:
+                self.stop()
+            raise
+
+        self._started = True
+        return self
 
-        # Wait for the exposed port
-        self.get_exposed_port(self._port)
+    def _finish_start(self, timeout: float) -> None:
+        """Wait for the server, store its endpoint and write the model.
 
-        # Wait for log message indicating server is ready
-        wait_for_logs(self, "grpc server started serving", timeout=30)
+        Args:
+            timeout: Maximum time to wait for the ready log message
+        """
+        # Look up the mapped port while waiting for the ready log message
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            port_future = executor.submit(self.get_exposed_port, self._port)
+            log_future = executor.submit(
+                self._wait_for_log_stream, READY_LOG_PATTERN, timeout
+            )
+            wait([port_future, log_future])
+            log_future.result()
+            port = port_future.result()
 
         # Store endpoint
-        host = self.get_container_host_ip()
-        port = self.get_exposed_port(self._port)
-        self._endpoint = f"{host}:{port}"
+        self._host = self.get_container_host_ip()
+        self._mapped_port = int(port)
+        self._endpoint = f"{self._host}:{self._mapped_port}"
+
+        # Confirm the mapped port accepts connections from the host
+        with socket.create_connection(self.get_endpoint_tuple(), timeout=1):
+            pass
 
         # Write schema if model is provided
         if self._model:
@@ -78,20 +231,147 @@ class SpiceDBContainer(DockerContainer):
             else:
                 self._default_schema_writer()
 
-        return self
+    def _reuse_hash(self) -> str:
+        """Hash the configuration that identifies a reusable container."""
+        kwargs = dict(self._kwargs)
+        labels = {
+            key: value
+            for key, value in (kwargs.pop("labels", None) or {}).items()
+            if key != REUSE_HASH_LABEL
+        }
+        config = {
+            "image": self.image,
+            "command": self._command,
+            "ports": {str(port): bind for port, bind in self.ports.items()},
+            "env": self.env,
+            "volumes": self.volumes,
+            "tmpfs": self.tmpfs,
+            "network": self._network.name if self._network else None,
+            "network_aliases": self._network_aliases,
+            "name": self._name,
+            "labels": labels,
+            "kwargs": kwargs,
+            "model": self._model,
+        }
+        encoded = json.dumps(config, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def _adopt_reusable_container(self) -> bool:
+        """Adopt a running container with the same configuration, if any.
+
+        When none is found, the reuse hash label is added so the container
+        created by start() can be adopted later.
+
+        Returns:
+            True if an existing container was adopted
+        """
+        reuse_hash = self._reuse_hash()
+        running = self.get_docker_client().client.containers.list(
+            filters={"label": f"{REUSE_HASH_LABEL}={reuse_hash}", "status": "running"}
+        )
+        if running:
+            self._container = running[0]
+            return True
+
+        labels = self._kwargs.get("labels") or {}
+        self._kwargs["labels"] = {**labels, REUSE_HASH_LABEL: reuse_hash}
+        return False
+
+    async def astart(self) -> "SpiceDBContainer":
+        """Start the container without blocking the event loop.
+
+        Runs start() in a worker thread, so several containers can boot
+        concurrently from the same loop.
+
+        Example:
+            >>> spicedb, other = await asyncio.gather(
+            ...     SpiceDBContainer().astart(),
+            ...     SpiceDBContainer(secret_key="other").astart(),
+            ... )
+        """
+        return await asyncio.to_thread(self.start)
+
+    def _wait_for_log_stream(self, pattern: str, timeout: float) -> None:
+        """Block until a container log line matches the given pattern.
+
+        Follows the Docker log stream instead of repeatedly fetching the
+        whole log buffer, as testcontainers' wait_for_logs does (it has no
+        streaming mode). The stream ends on its own if the container exits.
+
+        Args:
+            pattern: Regular expression to search for in each log line,
+                matched against the raw log bytes
+            timeout: Maximum time to wait in seconds
+
+        Raises:
+            TimeoutError: If no line matches within the timeout
+            RuntimeError: If the container exits before a line matches
+        """
+        regex = re.compile(pattern.encode())
+        container = self.get_wrapped_container()
+        stream = container.logs(stream=True, follow=True, stdout=True, stderr=True)
+        timed_out = threading.Event()
+
+        def expire() -> None:
+            timed_out.set()
+            stream.close()
+
+        timer = threading.Timer(timeout, expire)
+        timer.daemon = True
+        timer.start()
+        # Match raw bytes without decoding, carrying over only the
+        # unfinished last line so complete lines are never rescanned.
+        buffer = bytearray()
+        try:
+            for chunk in stream:
+                buffer += chunk
+                if regex.search(buffer):
+                    return
+                del buffer[:buffer.rfind(b"\n") + 1]
+        except Exception:
+            # Closing the socket from the timer may break the iterator
+            if not timed_out.is_set():
+                raise
+        finally:
+            timer.cancel()
+            stream.close()
+
+        if timed_out.is_set():
+            raise TimeoutError(
+                f"Container did not log {pattern!r} within {timeout} seconds"
+            )
+        container.reload()
+        raise RuntimeError(
+            f"Container exited with status {container.status!r} "
+            f"before logging {pattern!r}"
+        )
 
     def get_endpoint(self) -> str:
         """Get the gRPC endpoint for the SpiceDB container.
 
         Returns:
             The endpoint string in format 'host:port'
+
+        Raises:
+            RuntimeError: If the container has not been started
         """
-        if not self._endpoint:
-            host = self.get_container_host_ip()
-            port = self.get_exposed_port(self._port)
-            self._endpoint = f"{host}:{port}"
+        if self._endpoint is None:
+            raise RuntimeError("container not started")
         return self._endpoint
 
+    def get_endpoint_tuple(self) -> tuple[str, int]:
+        """Get the gRPC endpoint as separate host and port values.
+
+        Returns:
+            Tuple of (host, port)
+
+        Raises:
+            RuntimeError: If the container has not been started
+        """
+        if self._host is None or self._mapped_port is None:
+            raise RuntimeError("container not started")
+        return self._host, self._mapped_port
+
     def get_secret_key(self) -> str:
         """Get the gRPC pre-shared key.
 
@@ -100,22 +380,72 @@ class SpiceDBContainer(DockerContainer):
         """
         return self._secret_key
 
-    def _default_schema_writer(self) -> None:
-        """Write schema to SpiceDB using the default method."""
-        from authzed.api.v1 import Client
-        from grpcutil import insecure_bearer_token_credentials
+    def get_channel(self, secret_key: Optional[str] = None) -> "grpc.Channel":
+        """Get the gRPC channel behind the cached client for a secret key.
 
-        endpoint = self.get_endpoint()
+        Channels are tuned for short-lived local connections: no keepalive
+        pings, no retries and a subchannel pool that is not shared with
+        other channels.
 
-        # Create insecure client for local testing
-        client = Client(
-            endpoint,
-            insecure_bearer_token_credentials(self._model_secret_key)
-        )
+        Args:
+            secret_key: Secret key to authenticate with (defaults to secret_key)
+
+        Returns:
+            A gRPC channel
+        """
+        return self.get_client(secret_key).channel
+
+    def get_client(self, secret_key: Optional[str] = None) -> "ChannelClient":
+        """Get a SpiceDB client connected to the container.
 
-        # Write schema
-        request = WriteSchemaRequest(schema=self._model)
-        client.WriteSchema(request)
+        Clients are cached per endpoint and secret key, so repeated calls
+        reuse the same gRPC channel instead of opening a new one. The client
+        is synchronous even when called from a coroutine.
+
+        Args:
+            secret_key: Secret key to authenticate with (defaults to secret_key)
+
+        Returns:
+            An authzed v1 Client
+        """
+        from grpcutil import insecure_bearer_token_credentials
+        from testcontainers_spicedb._client import ChannelClient
+
+        key = (self.get_endpoint(), secret_key or self._secret_key)
+        if key not in self._client_cache:
+            self._client_cache[key] = ChannelClient(
+                key[0],
+                insecure_bearer_token_credentials(key[1]),
+                options=_CHANNEL_OPTIONS
+            )
+        return self._client_cache[key]
+
+    def stop(self, force: bool = True, delete_volume: bool = True) -> None:
+        """Close cached clients, then stop and remove the container.
+
+        With reuse enabled, a container that started successfully is left
+        running for the next run; one that failed to start is removed.
+        """
+        for client in self._client_cache.values():
+            client.channel.close()
+        self._client_cache.clear()
+        self._host = None
+        self._mapped_port = None
+        self._endpoint = None
+        # Only a container that finished starting is safe to adopt later
+        if self._reuse and self._started:
+            self._container = None
+        self._started = False
+        super().stop(force=force, delete_volume=delete_volume)
+
+    def _default_schema_writer(self) -> None:
+        """Write schema to SpiceDB using the default method."""
+        from authzed.api.v1 import WriteSchemaRequest
+
+        # WriteSchema replaces the whole schema, so it is always sent in
+        # one call; splitting it across calls would drop definitions.
+        client = self.get_client(self._model_secret_key)
+        client.WriteSchema(WriteSchemaRequest(schema=self._model))
 
 
 class SecretKeyCustomizer:
@@ -167,38 +497,3 @@ class ModelCustomizer:
         self.secret_key = secret_key
         self.schema_writer = schema_writer
 
-
-def with_otel(otel_provider: str, endpoint: str) -> dict:
-    """Add OpenTelemetry configuration to container.
-
-    Args:
-        otel_provider: The OTEL provider to use
-        endpoint: The OTEL endpoint
-
-    Returns:
-        Dictionary with command arguments to add
-    """
-    return {
-        "command_args": [
-            "--otel-endpoint", endpoint,
-            "--otel-provider", otel_provider
-        ]
-    }
-
-
-def with_http(port: str) -> dict:
-    """Enable HTTP endpoint on the specified port.
-
-    Args:
-        port: The port to expose for HTTP
-
-    Returns:
-        Dictionary with command arguments and exposed ports
-    """
-    return {
-        "command_args": [
-            "--http-enabled",
-            "--http-addr", f":{port}"
-        ],
-        "exposed_ports": [f"{port}/tcp"]
-    }
@@ -0,0 +1,80 @@
+"""Shared fixtures for SpiceDB testcontainer tests."""
+
+from unittest.mock import MagicMock
+
+import docker
+import docker.errors
+import pytest
+from authzed.api.v1 import (
+    DeleteRelationshipsRequest,
+    RelationshipFilter,
+    WriteSchemaRequest,
+)
+from testcontainers.core.config import testcontainers_config
+from testcontainers_spicedb import SpiceDBContainer
+from testcontainers_spicedb.spicedb import DEFAULT_IMAGE, DEFAULT_SECRET_KEY
+from testcontainers_spicedb.testdata import MODEL
+
+# Resource types in MODEL that can hold relationships
+MODEL_RESOURCE_TYPES = ("platform", "organization", "resource")
+
+
+@pytest.fixture
+def fake_docker(monkeypatch):
+    """Replace the Docker client so containers can be built without a daemon.
+
+    Returns the mock standing in for testcontainers' DockerClient.
+    """
+    docker_client = MagicMock()
+    monkeypatch.setattr(
+        "testcontainers.core.container.DockerClient",
+        lambda **kwargs: docker_client
+    )
+    monkeypatch.setattr(testcontainers_config, "ryuk_disabled", True)
+    docker_client.client.containers.list.return_value = []
+    return docker_client
+
+
+@pytest.fixture(scope="session")
+def _prepull():
+    """Pull the SpiceDB image, if missing, before the shared container starts."""
+    client = docker.from_env()
+    try:
+        client.images.get(DEFAULT_IMAGE)
+    except docker.errors.ImageNotFound:
+        client.images.pull(DEFAULT_IMAGE)
+    finally:
+        client.close()
+
+
+@pytest.fixture(scope="session")
+def spicedb(_prepull):
+    """Start one SpiceDB container, with MODEL pre-loaded, for the session."""
+    with SpiceDBContainer(
+        image="authzed/spicedb:v1.47.1",
+        model=MODEL,
+        model_secret_key=DEFAULT_SECRET_KEY
+    ) as container:
+        yield container
+
+
+@pytest.fixture
+def client(spicedb):
+    """Yield the shared container's client and reset its state afterwards.
+
+    The container caches clients per endpoint and secret key, so every
+    test reuses the same gRPC channel.
+    """
+    client = spicedb.get_client(DEFAULT_SECRET_KEY)
+    yield client
+
+    # Drop relationships written by the test and restore the original schema
+    for resource_type in MODEL_RESOURCE_TYPES:
+        client.DeleteRelationships(
+            DeleteRelationshipsRequest(
+                relationship_filter=RelationshipFilter(
+                    resource_type=resource_type
+                )
+            )
+        )
+    client.WriteSchema(WriteSchemaRequest(schema=MODEL))
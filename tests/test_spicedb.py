@@ -1,8 +1,10 @@
 """Tests for SpiceDB testcontainer module."""
 
-from grpcutil import insecure_bearer_token_credentials
+import threading
+from unittest.mock import MagicMock
+
+import pytest
 from authzed.api.v1 import (
-    Client,
     WriteSchemaRequest,
     WriteRelationshipsRequest,
     RelationshipUpdate,
@@ -11,26 +13,23 @@ from authzed.api.v1 import (
     SubjectReference,
 )
 from testcontainers_spicedb import SpiceDBContainer
+from testcontainers_spicedb.spicedb import (
+    DEFAULT_SECRET_KEY,
+    REUSE_HASH_LABEL,
+    _DEFAULT_COMMAND,
+)
 from testcontainers_spicedb.testdata import MODEL
 
 
-def test_spicedb_container():
+def test_spicedb_container(spicedb, client):
     """Test basic SpiceDB container functionality."""
-    with SpiceDBContainer(image="authzed/spicedb:v1.47.1") as container:
-        endpoint = container.get_endpoint()
-        secret_key = container.get_secret_key()
-
-        # Create SpiceDB client
-        client = Client(
-            endpoint,
-            insecure_bearer_token_credentials(secret_key)
-        )
+    assert spicedb.get_secret_key() == DEFAULT_SECRET_KEY
 
-        # Write schema
-        response = client.WriteSchema(WriteSchemaRequest(schema=MODEL))
+    # Write schema
+    response = client.WriteSchema(WriteSchemaRequest(schema=MODEL))
 
-        # Verify response
-        assert response.written_at is not None
+    # Verify response
+    assert response.written_at is not None
 
 
 def test_spicedb_secret_customizer():
@@ -46,13 +45,8 @@ def test_spicedb_secret_customizer():
         # Verify custom secret key
         assert secret_key == custom_secret
 
-        endpoint = container.get_endpoint()
-
         # Create SpiceDB client with custom secret
-        client = Client(
-            endpoint,
-            insecure_bearer_token_credentials(custom_secret)
-        )
+        client = container.get_client(custom_secret)
 
         # Write schema
         response = client.WriteSchema(WriteSchemaRequest(schema=MODEL))
@@ -61,46 +55,223 @@ def test_spicedb_secret_customizer():
         assert response.written_at is not None
 
 
-def test_spicedb_model_customizer():
+def test_spicedb_model_customizer(client):
     """Test SpiceDB container with model customizer."""
-    default_secret_key = "somepresharedkey"
-
-    with SpiceDBContainer(
-        image="authzed/spicedb:v1.47.1",
-        model=MODEL,
-        model_secret_key=default_secret_key
-    ) as container:
-        endpoint = container.get_endpoint()
-
-        # Create SpiceDB client
-        client = Client(
-            endpoint,
-            insecure_bearer_token_credentials(default_secret_key)
-        )
-
-        # Write relationships (schema should already be loaded)
-        response = client.WriteRelationships(
-            WriteRelationshipsRequest(
-                updates=[
-                    RelationshipUpdate(
-                        operation=RelationshipUpdate.OPERATION_CREATE,
-                        relationship=Relationship(
-                            resource=ObjectReference(
-                                object_id="testplatform",
-                                object_type="platform"
-                            ),
-                            relation="administrator",
-                            subject=SubjectReference(
-                                object=ObjectReference(
-                                    object_id="testuser",
-                                    object_type="user"
-                                )
+    # Write relationships (schema should already be loaded)
+    response = client.WriteRelationships(
+        WriteRelationshipsRequest(
+            updates=[
+                RelationshipUpdate(
+                    operation=RelationshipUpdate.OPERATION_CREATE,
+                    relationship=Relationship(
+                        resource=ObjectReference(
+                            object_id="testplatform",
+                            object_type="platform"
+                        ),
+                        relation="administrator",
+                        subject=SubjectReference(
+                            object=ObjectReference(
+                                object_id="testuser",
+                                object_type="user"
                             )
                         )
                     )
-                ]
-            )
+                )
+            ]
         )
+    )
+
+    # Verify response
+    assert response.written_at is not None
+
+
+def test_spicedb_custom_command():
+    """Test that a command set with with_command is not overwritten."""
+    custom_secret = "commandsecret"
+
+    with SpiceDBContainer(image="authzed/spicedb:v1.47.1").with_command([
+        "serve",
+        "--grpc-preshared-key",
+        custom_secret
+    ]) as container:
+        # Only the custom command's secret key is accepted
+        client = container.get_client(custom_secret)
+
+        # Write schema
+        response = client.WriteSchema(WriteSchemaRequest(schema=MODEL))
+
+        # Verify response
+        assert response.written_at is not None
+
+
+@pytest.mark.asyncio
+async def test_spicedb_astart():
+    """Test starting SpiceDB container from async code."""
+    container = await SpiceDBContainer(image="authzed/spicedb:v1.47.1").astart()
+
+    try:
+        client = container.get_client()
+
+        # Write schema
+        response = client.WriteSchema(WriteSchemaRequest(schema=MODEL))
 
         # Verify response
         assert response.written_at is not None
+    finally:
+        container.stop()
+
+
+def test_reuse_hash_is_stable(fake_docker):
+    """Test that the reuse hash survives the reuse label being added."""
+    container = SpiceDBContainer(reuse=True)
+    container.with_command(container._build_command())
+    reuse_hash = container._reuse_hash()
+
+    # No running match, so the label is added for the next run
+    assert not container._adopt_reusable_container()
+    assert container._kwargs["labels"][REUSE_HASH_LABEL] == reuse_hash
+    assert container._reuse_hash() == reuse_hash
+
+    other = SpiceDBContainer(reuse=True)
+    other.with_command(other._build_command())
+    assert other._reuse_hash() == reuse_hash
+
+
+def test_reuse_hash_tracks_config(fake_docker):
+    """Test that configuration changes produce a different reuse hash."""
+    def reuse_hash(container):
+        if not container._command_overridden:
+            container.with_command(container._build_command())
+        return container._reuse_hash()
+
+    base = reuse_hash(SpiceDBContainer())
+    variants = [
+        SpiceDBContainer().with_command(["serve", "--grpc-preshared-key", "x"]),
+        SpiceDBContainer().with_env("SPICEDB_LOG_LEVEL", "debug"),
+        SpiceDBContainer().with_exposed_ports(8443),
+        SpiceDBContainer(model=MODEL),
+    ]
+
+    for variant in variants:
+        assert reuse_hash(variant) != base
+
+
+def test_reuse_keeps_container_after_successful_start(fake_docker, monkeypatch):
+    """Test that stop() leaves a successfully started reused container running."""
+    running = MagicMock()
+    fake_docker.client.containers.list.return_value = [running]
+    container = SpiceDBContainer(reuse=True)
+    monkeypatch.setattr(container, "_finish_start", lambda timeout: None)
+
+    container.start()
+    container.stop()
+
+    running.remove.assert_not_called()
+
+
+def test_reuse_removes_container_after_failed_start(fake_docker, monkeypatch):
+    """Test that a reused container that fails to start is removed."""
+    running = MagicMock()
+    fake_docker.client.containers.list.return_value = [running]
+    container = SpiceDBContainer(reuse=True)
+
+    def fail(timeout):
+        raise TimeoutError("not ready")
+
+    monkeypatch.setattr(container, "_finish_start", fail)
+
+    with pytest.raises(TimeoutError):
+        container.start()
+
+    running.remove.assert_called_once()
+
+
+def test_build_command_default(fake_docker):
+    """Test that the default container uses the shared default command."""
+    assert SpiceDBContainer()._build_command() is _DEFAULT_COMMAND
+
+
+def test_build_command_with_builders(fake_docker):
+    """Test that with_http and with_otel add their flags and HTTP port."""
+    container = SpiceDBContainer().with_http(8443).with_otel(
+        "otlpgrpc", "otel-collector:4317"
+    )
+
+    command = list(container._build_command())
+
+    assert command[:3] == list(_DEFAULT_COMMAND)
+    assert command[3:] == [
+        "--http-enabled",
+        "--http-addr", ":8443",
+        "--otel-endpoint", "otel-collector:4317",
+        "--otel-provider", "otlpgrpc",
+    ]
+    assert "8443" in container.ports
+
+
+class FakeLogStream:
+    """Docker log stream that yields chunks, then optionally blocks."""
+
+    def __init__(self, chunks, block=False):
+        self.chunks = chunks
+        self.block = block
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        yield from self.chunks
+        if self.block:
+            self.closed.wait()
+
+    def close(self):
+        self.closed.set()
+
+
+def stream_container(monkeypatch, stream):
+    """Build a container whose wrapped Docker container logs the stream."""
+    container = SpiceDBContainer()
+    wrapped = MagicMock(status="exited")
+    wrapped.logs.return_value = stream
+    monkeypatch.setattr(container, "get_wrapped_container", lambda: wrapped)
+    return container
+
+
+def test_wait_for_log_stream_match_across_chunks(fake_docker, monkeypatch):
+    """Test that a ready line split across chunks is matched."""
+    stream = FakeLogStream([b"starting\ngrpc server sta", b"rted serving\n"])
+    container = stream_container(monkeypatch, stream)
+
+    container._wait_for_log_stream("grpc server started serving", timeout=5)
+
+    assert stream.closed.is_set()
+
+
+def test_wait_for_log_stream_container_exit(fake_docker, monkeypatch):
+    """Test that a log stream ending without a match raises RuntimeError."""
+    stream = FakeLogStream([b"starting\n", b"fatal error\n"])
+    container = stream_container(monkeypatch, stream)
+
+    with pytest.raises(RuntimeError, match="exited"):
+        container._wait_for_log_stream("grpc server started serving", timeout=5)
+
+
+def test_wait_for_log_stream_timeout(fake_docker, monkeypatch):
+    """Test that a stalled log stream raises TimeoutError."""
+    stream = FakeLogStream([b"starting\n"], block=True)
+    container = stream_container(monkeypatch, stream)
+
+    with pytest.raises(TimeoutError):
+        container._wait_for_log_stream("grpc server started serving", timeout=0.1)
+
+
+def test_stop_clears_endpoint(fake_docker):
+    """Test that the endpoint is no longer reported after stop()."""
+    container = SpiceDBContainer()
+    container._host, container._mapped_port = "localhost", 50051
+    container._endpoint = "localhost:50051"
+
+    container.stop()
+
+    with pytest.raises(RuntimeError, match="not started"):
+        container.get_endpoint()
+    with pytest.raises(RuntimeError, match="not started"):
+        container.get_endpoint_tuple()